@@ -1,8 +1,28 @@
 """BalatroBot - API for developing Balatro bots."""
 
-from balatrobot.cli.client import APIError, BalatroClient
+from typing import TYPE_CHECKING
+
+from balatrobot.cli.client import APIError, AsyncBalatroClient, BalatroClient
 from balatrobot.config import Config
-from balatrobot.manager import BalatroInstance
+
+if TYPE_CHECKING:
+    from balatrobot.manager import BalatroInstance
 
 __version__ = "1.4.1"
-__all__ = ["APIError", "BalatroClient", "BalatroInstance", "Config", "__version__"]
+__all__ = [
+    "APIError",
+    "AsyncBalatroClient",
+    "BalatroClient",
+    "BalatroInstance",
+    "Config",
+    "__version__",
+]
+
+
+def __getattr__(name: str):
+    """Import BalatroInstance on first use so the CLI client stays light."""
+    if name == "BalatroInstance":
+        from balatrobot.manager import BalatroInstance
+
+        return BalatroInstance
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
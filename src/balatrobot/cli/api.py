@@ -9,6 +9,9 @@ import typer
 
 from balatrobot.cli.client import APIError, BalatroClient
 
+# Default JSON params, short-circuited without calling json.loads
+_EMPTY_PARAMS = "{}"
+
 
 class Method(StrEnum):
     """Valid API methods."""
@@ -38,26 +41,33 @@ class Method(StrEnum):
 
 def api(
     method: Annotated[Method, typer.Argument(help="API method to call")],
-    params: Annotated[str, typer.Argument(help="JSON params object")] = "{}",
+    params: Annotated[str, typer.Argument(help="JSON params object")] = _EMPTY_PARAMS,
     host: Annotated[str, typer.Option(help="Server hostname")] = "127.0.0.1",
     port: Annotated[int, typer.Option(help="Server port")] = 12346,
 ) -> None:
     """Call API endpoint on a running BalatroBot server."""
     # Validate JSON params
-    try:
-        params_dict = json.loads(params)
-    except json.JSONDecodeError as e:
-        typer.echo(f"Error: Invalid JSON params - {e}", err=True)
-        raise typer.Exit(code=1)
+    if params == _EMPTY_PARAMS:
+        params_dict = {}
+    else:
+        try:
+            params_dict = json.loads(params)
+        except json.JSONDecodeError as e:
+            typer.echo(f"Error: Invalid JSON params - {e}", err=True)
+            raise typer.Exit(code=1)
 
     # Make API call
-    client = BalatroClient(host=host, port=port)
-    try:
-        result = client.call(method.value, params_dict)
-        typer.echo(json.dumps(result, indent=2))
-    except APIError as e:
-        typer.echo(f"Error: {e.name} - {e.message}", err=True)
-        raise typer.Exit(code=1)
-    except (httpx.ConnectError, httpx.TimeoutException, httpx.HTTPStatusError) as e:
-        typer.echo(f"Error: Connection failed - {e}", err=True)
-        raise typer.Exit(code=1)
+    with BalatroClient(host=host, port=port) as client:
+        try:
+            result = client.call(method, params_dict)
+            typer.echo(json.dumps(result, indent=2))
+        except APIError as e:
+            typer.echo(f"Error: {e.name} - {e.message}", err=True)
+            raise typer.Exit(code=1)
+        except (
+            httpx.ConnectError,
+            httpx.TimeoutException,
+            httpx.HTTPStatusError,
+        ) as e:
+            typer.echo(f"Error: Connection failed - {e}", err=True)
+            raise typer.Exit(code=1)
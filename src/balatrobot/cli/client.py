@@ -1,7 +1,8 @@
 """Client for BalatroBot JSON-RPC 2.0 API."""
 
+from collections.abc import Iterable
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Self
 
 import httpx
 
@@ -16,9 +17,33 @@ class APIError(Exception):
         super().__init__(f"{name}: {message}")
 
 
+def _parse_response(data: dict[str, Any]) -> dict[str, Any]:
+    """Return the result of a JSON-RPC 2.0 response or raise APIError."""
+    if "error" in data:
+        error = data["error"]
+        raise APIError(
+            name=error["data"]["name"],
+            message=error["message"],
+            code=error["code"],
+        )
+    return data["result"]
+
+
+def _build_payload(
+    method: str, params: dict[str, Any] | None, request_id: int
+) -> dict[str, Any]:
+    """Build a JSON-RPC 2.0 request payload."""
+    return {
+        "jsonrpc": "2.0",
+        "method": method,
+        "params": params or {},
+        "id": request_id,
+    }
+
+
 @dataclass
-class BalatroClient:
-    """Sync client for BalatroBot API."""
+class _BaseClient:
+    """Connection settings and request counter shared by both clients."""
 
     host: str = "127.0.0.1"
     port: int = 12346
@@ -29,6 +54,25 @@ class BalatroClient:
     def url(self) -> str:
         return f"http://{self.host}:{self.port}"
 
+    def _next_payload(
+        self, method: str, params: dict[str, Any] | None
+    ) -> dict[str, Any]:
+        """Advance the request counter and build the payload for one call."""
+        self._request_id += 1
+        return _build_payload(method, params, self._request_id)
+
+
+@dataclass
+class BalatroClient(_BaseClient):
+    """Sync client for BalatroBot API.
+
+    The underlying `httpx.Client` is created on the first call and reused for
+    all subsequent calls. Use the client as a context manager (or call
+    `close()`) to release it.
+    """
+
+    _client: httpx.Client | None = field(default=None, init=False, repr=False)
+
     def call(self, method: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
         """Call a JSON-RPC 2.0 method and return the result.
 
@@ -36,23 +80,84 @@ class BalatroClient:
             APIError: If the API returns an error response.
             httpx.ConnectError: If connection to server fails.
         """
-        self._request_id += 1
-        payload = {
-            "jsonrpc": "2.0",
-            "method": method,
-            "params": params or {},
-            "id": self._request_id,
-        }
-        with httpx.Client(timeout=self.timeout) as client:
-            response = client.post(self.url, json=payload)
-            response.raise_for_status()
-            data = response.json()
-
-        if "error" in data:
-            error = data["error"]
-            raise APIError(
-                name=error["data"]["name"],
-                message=error["message"],
-                code=error["code"],
+        if self._client is None:
+            self._client = httpx.Client(base_url=self.url, timeout=self.timeout)
+
+        payload = self._next_payload(method, params)
+        response = self._client.post("/", json=payload)
+        response.raise_for_status()
+        return _parse_response(response.json())
+
+    def close(self) -> None:
+        """Close the underlying HTTP client, if any."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+@dataclass
+class AsyncBalatroClient(_BaseClient):
+    """Async client for BalatroBot API.
+
+    All calls share one `httpx.AsyncClient` limited to a single connection:
+    the server handles one client at a time, so concurrent calls are queued
+    and sent in the order they were made.
+    """
+
+    _client: httpx.AsyncClient | None = field(default=None, init=False, repr=False)
+
+    async def call(
+        self, method: str, params: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """Call a JSON-RPC 2.0 method and return the result.
+
+        Raises:
+            APIError: If the API returns an error response.
+            httpx.ConnectError: If connection to server fails.
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.url,
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=1),
             )
-        return data["result"]
+
+        payload = self._next_payload(method, params)
+        response = await self._client.post("/", json=payload)
+        response.raise_for_status()
+        return _parse_response(response.json())
+
+    async def call_many(
+        self, calls: Iterable[tuple[str, dict[str, Any] | None]]
+    ) -> list[dict[str, Any]]:
+        """Call several JSON-RPC 2.0 methods and return their results in order.
+
+        Raises:
+            APIError: If any call returns an error response.
+            httpx.ConnectError: If connection to server fails.
+        """
+        import asyncio  # Lazy: keeps `balatrobot api` from loading the event loop
+
+        return list(
+            await asyncio.gather(
+                *(self.call(method, params) for method, params in calls)
+            )
+        )
+
+    async def close(self) -> None:
+        """Close the underlying HTTP client, if any."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
@@ -1,12 +1,10 @@
 """Serve command - Start Balatro with BalatroBot mod loaded."""
 
-import asyncio
 from typing import Annotated
 
 import typer
 
 from balatrobot.config import Config
-from balatrobot.manager import BalatroInstance
 
 # Platform choices for validation
 PLATFORM_CHOICES = ["darwin", "linux", "windows", "native"]
@@ -72,6 +70,9 @@ def serve(
         )
         raise typer.Exit(code=1)
 
+    # Imported here so other commands don't pay for asyncio and the manager
+    import asyncio
+
     # Build config from kwargs with env var fallback
     config = Config.from_kwargs(
         host=host,
@@ -102,7 +103,12 @@ def serve(
 
 async def _serve(config: Config) -> None:
     """Async serve implementation."""
+    from balatrobot.manager import BalatroInstance
+
     async with BalatroInstance(config) as instance:
         typer.echo(f"Balatro running on port {instance.port}. Press Ctrl+C to stop.")
-        while True:
-            await asyncio.sleep(5)
+        returncode = await instance.process.wait()
+
+    typer.echo(f"Balatro exited with code {returncode}", err=True)
+    if returncode:
+        raise typer.Exit(code=1)
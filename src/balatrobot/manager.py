@@ -1,9 +1,9 @@
 """Context manager for a Balatro instance."""
 
 import asyncio
-import subprocess
+import json
+import time
 from dataclasses import replace
-from datetime import datetime
 from pathlib import Path
 
 import httpx
@@ -12,6 +12,14 @@ from balatrobot.config import Config
 from balatrobot.platforms import get_launcher
 
 HEALTH_TIMEOUT = 30.0
+HEALTH_POLL_MIN = 0.025  # First delay between health probes (seconds)
+HEALTH_POLL_MAX = 0.5  # Upper bound for the backoff delay (seconds)
+
+# Health check request body, encoded once and reused by every probe
+HEALTH_REQUEST = json.dumps(
+    {"jsonrpc": "2.0", "method": "health", "params": {}, "id": 1}
+).encode()
+HEALTH_HEADERS = {"Content-Type": "application/json"}
 
 
 class BalatroInstance:
@@ -29,7 +37,7 @@ class BalatroInstance:
         """
         base = config or Config.from_env()
         self._config = replace(base, **overrides) if overrides else base
-        self._process: subprocess.Popen | None = None
+        self._process: asyncio.subprocess.Process | None = None
         self._log_path: Path | None = None
         self._session_id = session_id
 
@@ -39,7 +47,7 @@ class BalatroInstance:
         return self._config.port
 
     @property
-    def process(self) -> subprocess.Popen:
+    def process(self) -> asyncio.subprocess.Process:
         """Get the subprocess. Raises if not started."""
         if self._process is None:
             raise RuntimeError("Instance not started")
@@ -50,35 +58,49 @@ class BalatroInstance:
         """Get the log file path, if available."""
         return self._log_path
 
-    async def _wait_for_health(self, timeout: float = HEALTH_TIMEOUT) -> None:
+    async def _wait_for_health(
+        self,
+        timeout: float = HEALTH_TIMEOUT,
+        client: httpx.AsyncClient | None = None,
+    ) -> None:
         """Wait for health endpoint to respond."""
+        if client is not None:
+            return await self._poll_health(client, timeout)
+        async with httpx.AsyncClient(timeout=2.0) as own_client:
+            await self._poll_health(own_client, timeout)
+
+    async def _poll_health(self, client: httpx.AsyncClient, timeout: float) -> None:
+        """Probe the health endpoint with backoff until it reports ok."""
         url = f"http://{self._config.host}:{self._config.port}"
-        payload = {"jsonrpc": "2.0", "method": "health", "params": {}, "id": 1}
-        start = asyncio.get_event_loop().time()
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        delay = HEALTH_POLL_MIN
 
-        while asyncio.get_event_loop().time() - start < timeout:
+        while loop.time() - start < timeout:
             try:
-                async with httpx.AsyncClient(timeout=2.0) as client:
-                    response = await client.post(url, json=payload)
-                    data = response.json()
-                    if "result" in data and data["result"].get("status") == "ok":
-                        return
+                response = await client.post(
+                    url, content=HEALTH_REQUEST, headers=HEALTH_HEADERS
+                )
+                data = response.json()
+                if "result" in data and data["result"].get("status") == "ok":
+                    return
             except (httpx.ConnectError, httpx.TimeoutException):
                 pass
-            await asyncio.sleep(0.5)
+            await asyncio.sleep(delay)
+            delay = min(delay * 1.6, HEALTH_POLL_MAX)
 
         raise RuntimeError(
             f"Health check failed after {timeout}s on "
             f"{self._config.host}:{self._config.port}"
         )
 
-    async def start(self) -> None:
-        """Start the Balatro instance and wait for health."""
+    async def spawn(self) -> None:
+        """Launch the Balatro process without waiting for health."""
         if self._process is not None:
             raise RuntimeError("Instance already started")
 
         # Create session directory (use provided session_id or generate one)
-        timestamp = self._session_id or datetime.now().strftime("%Y-%m-%dT%H-%M-%S")
+        timestamp = self._session_id or time.strftime("%Y-%m-%dT%H-%M-%S")
         session_dir = Path(self._config.logs_path) / timestamp
         session_dir.mkdir(parents=True, exist_ok=True)
         self._log_path = session_dir / f"{self._config.port}.log"
@@ -89,39 +111,61 @@ class BalatroInstance:
 
         self._process = await launcher.start(self._config, session_dir)
 
-        # Wait for health
+    async def wait_ready(self, client: httpx.AsyncClient | None = None) -> None:
+        """Wait for a spawned instance to pass its health check.
+
+        Pass a shared ``client`` to probe several instances over one connection
+        pool; the instance is stopped if it never becomes healthy.
+        """
+        process = self.process
         print(f"Waiting for health check on {self._config.host}:{self._config.port}...")
         try:
-            await self._wait_for_health()
+            await self._wait_for_health(client=client)
         except RuntimeError as e:
             await self.stop()
             raise RuntimeError(f"{e}. Check log file: {self._log_path}") from e
 
-        print(f"Balatro started (PID: {self._process.pid})")
+        print(f"Balatro started (PID: {process.pid})")
 
-    async def stop(self) -> None:
-        """Stop the Balatro instance."""
+    async def start(self) -> None:
+        """Start the Balatro instance and wait for health."""
+        await self.spawn()
+        await self.wait_ready()
+
+    def terminate(self) -> None:
+        """Ask the Balatro process to exit without waiting for it.
+
+        Call wait() afterwards to reap it. Does nothing if not started.
+        """
         if self._process is None:
             return
 
-        process = self._process
-        self._process = None
-
         print(f"Stopping instance on port {self._config.port}...")
 
-        # Try graceful termination first
-        process.terminate()
+        try:
+            self._process.terminate()
+        except ProcessLookupError:
+            pass  # Already exited
+
+    async def wait(self, timeout: float = 5) -> None:
+        """Wait for a terminated process to exit, force killing it on timeout."""
+        if self._process is None:
+            return
+
+        process = self._process
+        self._process = None
 
-        loop = asyncio.get_running_loop()
         try:
-            await asyncio.wait_for(
-                loop.run_in_executor(None, process.wait),
-                timeout=5,
-            )
+            await asyncio.wait_for(process.wait(), timeout=timeout)
         except asyncio.TimeoutError:
             print(f"Force killing instance on port {self._config.port}...")
             process.kill()
-            await loop.run_in_executor(None, process.wait)
+            await process.wait()
+
+    async def stop(self) -> None:
+        """Stop the Balatro instance."""
+        self.terminate()
+        await self.wait()
 
     async def __aenter__(self) -> "BalatroInstance":
         """Start instance on context entry."""
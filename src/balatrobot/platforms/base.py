@@ -1,6 +1,7 @@
 """Base launcher class for all platforms."""
 
-import subprocess
+import asyncio
+import os
 from abc import ABC, abstractmethod
 from pathlib import Path
 
@@ -35,11 +36,13 @@ class BaseLauncher(ABC):
         """Build command list for subprocess.
 
         Returns:
-            Command list suitable for subprocess.Popen.
+            Command list suitable for asyncio.create_subprocess_exec.
         """
         ...
 
-    async def start(self, config: Config, session_dir: Path) -> subprocess.Popen:
+    async def start(
+        self, config: Config, session_dir: Path
+    ) -> asyncio.subprocess.Process:
         """Start Balatro with the given configuration.
 
         Args:
@@ -47,7 +50,7 @@ class BaseLauncher(ABC):
             session_dir: Directory for log files.
 
         Returns:
-            The subprocess.Popen object.
+            The asyncio.subprocess.Process object.
 
         Raises:
             RuntimeError: If startup fails.
@@ -58,12 +61,16 @@ class BaseLauncher(ABC):
 
         log_path = session_dir / f"{config.port}.log"
 
-        with open(log_path, "w") as log:
-            process = subprocess.Popen(
-                cmd,
+        # The child inherits its own copy of the descriptor
+        log_fd = os.open(log_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
                 env=env,
-                stdout=log,
-                stderr=subprocess.STDOUT,
+                stdout=log_fd,
+                stderr=asyncio.subprocess.STDOUT,
             )
+        finally:
+            os.close(log_fd)
 
         return process
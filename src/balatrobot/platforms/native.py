@@ -8,23 +8,30 @@ from pathlib import Path
 from balatrobot.config import Config
 from balatrobot.platforms.base import BaseLauncher
 
+# Paths found by the detectors below; a miss is not cached, so it is retried
+_love_path: Path | None = None
+_lovely_path: Path | None = None
+
 
 def _detect_love_path() -> Path | None:
-    """Detect LOVE executable in PATH."""
-    found = shutil.which("love")
-    return Path(found) if found else None
+    """Detect LOVE executable in PATH (remembered once found)."""
+    global _love_path
+    if _love_path is None:
+        found = shutil.which("love")
+        _love_path = Path(found) if found else None
+    return _love_path
 
 
 def _detect_lovely_path() -> Path | None:
-    """Detect liblovely.so in standard locations."""
-    candidates = [
-        Path("/usr/local/lib/liblovely.so"),
-        Path.home() / ".local/lib/liblovely.so",
-    ]
-    for candidate in candidates:
-        if candidate.is_file():
-            return candidate
-    return None
+    """Detect liblovely.so in standard locations (remembered once found)."""
+    global _lovely_path
+    if _lovely_path is None:
+        candidates = [
+            Path("/usr/local/lib/liblovely.so"),
+            Path.home() / ".local/lib/liblovely.so",
+        ]
+        _lovely_path = next((c for c in candidates if c.is_file()), None)
+    return _lovely_path
 
 
 class NativeLauncher(BaseLauncher):
@@ -1,16 +1,14 @@
 """Shared test fixtures for CLI tests."""
 
-import asyncio
 import os
-import random
 from pathlib import Path
+from typing import Generator
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from balatrobot.cli.client import BalatroClient
-from balatrobot.config import ENV_MAP, Config
-from balatrobot.manager import BalatroInstance
+from balatrobot.config import ENV_MAP
 
 # ============================================================================
 # Constants
@@ -18,86 +16,30 @@ from balatrobot.manager import BalatroInstance
 
 HOST = "127.0.0.1"
 
+# Path prefix of this directory, for cheap string checks during collection
+_DIR_PREFIX = str(Path(__file__).parent) + os.sep
+
 # Files that contain integration tests requiring Balatro
-INTEGRATION_FILES = {
-    "test_client.py",
-    "test_api_cmd.py",
-    "test_serve_cmd.py",
-    "test_integration.py",
-}
+INTEGRATION_FILES = frozenset(
+    {
+        "test_client.py",
+        "test_api_cmd.py",
+        "test_serve_cmd.py",
+        "test_integration.py",
+    }
+)
 
 
 # ============================================================================
-# Pytest Hooks for Balatro Instance Management
+# Pytest Hooks
 # ============================================================================
 
 
-def pytest_configure(config):
-    """Start Balatro instances for integration tests (master only)."""
-    # Skip if xdist worker (master handles startup)
-    if os.environ.get("PYTEST_XDIST_WORKER"):
-        return
-
-    # Determine parallelism
-    numprocesses = getattr(config.option, "numprocesses", None)
-    parallel = numprocesses if numprocesses and numprocesses > 0 else 1
-
-    # Allocate random ports
-    ports = random.sample(range(20000, 30000), parallel)
-    os.environ["BALATROBOT_CLI_PORTS"] = ",".join(str(p) for p in ports)
-
-    config._cli_balatro_ports = ports
-    config._cli_balatro_parallel = parallel
-
-    # Start instances
-    base_config = Config.from_env()
-    instances: list[BalatroInstance] = []
-
-    async def start_all():
-        for port in ports:
-            instances.append(BalatroInstance(base_config, port=port))
-        await asyncio.gather(*[inst.start() for inst in instances])
-        print(f"CLI tests: {parallel} Balatro instance(s) started on ports: {ports}")
-
-    try:
-        asyncio.run(start_all())
-        config._cli_balatro_instances = instances
-    except Exception as e:
-        # Cleanup on failure
-        async def cleanup():
-            for instance in instances:
-                await instance.stop()
-
-        asyncio.run(cleanup())
-        raise pytest.UsageError(f"Could not start Balatro instances: {e}") from e
-
-
-def pytest_unconfigure(config):
-    """Stop Balatro instances after tests complete."""
-    instances = getattr(config, "_cli_balatro_instances", None)
-    if instances is None:
-        return
-
-    async def stop_all():
-        for instance in instances:
-            await instance.stop()
-
-    try:
-        asyncio.run(stop_all())
-    except Exception as e:
-        print(f"Error stopping Balatro instances: {e}")
-
-
 def pytest_collection_modifyitems(items):
     """Mark integration test files automatically."""
-    current_dir = Path(__file__).parent
-
     for item in items:
         # Only process items in this directory
-        if (
-            current_dir not in Path(item.path).parents
-            and Path(item.path).parent != current_dir
-        ):
+        if not str(item.path).startswith(_DIR_PREFIX):
             continue
 
         # Mark files that need Balatro as integration tests
@@ -111,22 +53,29 @@ def pytest_collection_modifyitems(items):
 
 
 @pytest.fixture(scope="session")
-def cli_port(worker_id) -> int:
-    """Get assigned port for this worker from env var."""
-    ports_str = os.environ.get("BALATROBOT_CLI_PORTS", "12346")
-    ports = [int(p) for p in ports_str.split(",")]
+def _session_client(port: int) -> Generator[BalatroClient, None, None]:
+    """BalatroClient shared by every test on this worker."""
+    with BalatroClient(host=HOST, port=port) as client:
+        yield client
 
-    if worker_id == "master":
-        return ports[0]
 
-    worker_num = int(worker_id.replace("gw", ""))
-    return ports[worker_num]
+@pytest.fixture(scope="module")
+def _menu_state(_session_client: BalatroClient) -> None:
+    """Return the game to MENU once per module that talks to it."""
+    _session_client.call("menu")
 
 
 @pytest.fixture
-def balatro_client(cli_port: int) -> BalatroClient:
-    """Create BalatroClient connected to test server."""
-    return BalatroClient(host=HOST, port=cli_port)
+def balatro_client(_session_client: BalatroClient, _menu_state) -> BalatroClient:
+    """Shared BalatroClient, game in MENU."""
+    return _session_client
+
+
+@pytest.fixture
+def dirty_state(balatro_client: BalatroClient):
+    """For tests that leave MENU: restore it on teardown for the next test."""
+    yield
+    balatro_client.call("menu")
 
 
 # ============================================================================
@@ -143,16 +92,16 @@ def clean_env(monkeypatch):
 
 
 @pytest.fixture
-def mock_popen(monkeypatch):
-    """Mock subprocess.Popen for lifecycle tests."""
+def mock_subprocess(monkeypatch):
+    """Mock asyncio.create_subprocess_exec for lifecycle tests."""
     mock_process = MagicMock()
     mock_process.pid = 12345
     mock_process.terminate = MagicMock()
     mock_process.kill = MagicMock()
-    mock_process.wait = MagicMock(return_value=0)
+    mock_process.wait = AsyncMock(return_value=0)
 
-    mock_popen_cls = MagicMock(return_value=mock_process)
-    monkeypatch.setattr("subprocess.Popen", mock_popen_cls)
+    mock_create = AsyncMock(return_value=mock_process)
+    monkeypatch.setattr("asyncio.create_subprocess_exec", mock_create)
 
     return mock_process
 
@@ -2,80 +2,84 @@
 
 import json
 
+import pytest
 from typer.testing import CliRunner
 
 from balatrobot.cli import app
+from balatrobot.cli.api import Method
 from balatrobot.cli.client import BalatroClient
 
 runner = CliRunner()
 
+_METHODS = tuple(m.value for m in Method)
+
 
 class TestApiCommand:
     """Test balatrobot api command."""
 
     # --- Happy path tests ---
-
-    def test_api_health_success(self, cli_port: int):
-        """api health returns JSON result."""
-        result = runner.invoke(app, ["api", "health", "--port", str(cli_port)])
-        assert result.exit_code == 0
-        data = json.loads(result.output)
-        assert data["status"] == "ok"
-
-    def test_api_gamestate_success(self, cli_port: int, balatro_client: BalatroClient):
-        """api gamestate returns state."""
-        balatro_client.call("menu")  # Reset state
-        result = runner.invoke(app, ["api", "gamestate", "--port", str(cli_port)])
+    # These run the full command on purpose: they are the only end-to-end
+    # coverage of what `balatrobot api` prints for a successful call.
+
+    @pytest.mark.parametrize(
+        "method,key,expected",
+        [("health", "status", "ok"), ("gamestate", "state", "MENU")],
+    )
+    def test_api_simple_get(
+        self,
+        port: int,
+        balatro_client: BalatroClient,
+        method: str,
+        key: str,
+        expected: str,
+    ):
+        """Parameterless methods print their result as JSON."""
+        result = runner.invoke(app, ["api", method, "--port", str(port)])
         assert result.exit_code == 0
         data = json.loads(result.output)
-        assert "state" in data
+        assert data[key] == expected
 
-    def test_api_with_params(self, cli_port: int, balatro_client: BalatroClient):
+    def test_api_with_params(
+        self, port: int, balatro_client: BalatroClient, dirty_state
+    ):
         """api command passes JSON params correctly."""
-        balatro_client.call("menu")
         params = json.dumps({"deck": "RED", "stake": "WHITE"})
-        result = runner.invoke(app, ["api", "start", params, "--port", str(cli_port)])
+        result = runner.invoke(app, ["api", "start", params, "--port", str(port)])
         assert result.exit_code == 0
 
     # --- Method validation tests ---
 
-    def test_api_invalid_method(self, cli_port: int):
+    def test_api_invalid_method(self, port: int):
         """Invalid method name rejected by Typer."""
-        result = runner.invoke(app, ["api", "invalid_method", "--port", str(cli_port)])
+        result = runner.invoke(app, ["api", "invalid_method", "--port", str(port)])
         assert result.exit_code == 2  # Typer validation error
         assert "invalid_method" in result.output.lower()
 
     def test_api_all_methods_valid(self):
         """All Method enum values are valid strings."""
-        from balatrobot.cli.api import Method
-
-        methods = [m.value for m in Method]
-        assert len(methods) == 21
-        assert "health" in methods
-        assert "gamestate" in methods
+        assert len(_METHODS) == 21
+        assert "health" in _METHODS
+        assert "gamestate" in _METHODS
 
     # --- JSON validation tests ---
 
-    def test_api_invalid_json_params(self, cli_port: int):
+    def test_api_invalid_json_params(self, port: int):
         """Invalid JSON params return error."""
-        result = runner.invoke(
-            app, ["api", "health", "{bad json", "--port", str(cli_port)]
-        )
+        result = runner.invoke(app, ["api", "health", "{bad json", "--port", str(port)])
         assert result.exit_code == 1
         assert "Invalid JSON params" in result.output
 
-    def test_api_empty_params_default(self, cli_port: int):
+    def test_api_empty_params_default(self, port: int):
         """Empty params default to {}."""
-        result = runner.invoke(app, ["api", "health", "--port", str(cli_port)])
+        result = runner.invoke(app, ["api", "health", "--port", str(port)])
         assert result.exit_code == 0
 
     # --- API error handling tests ---
 
-    def test_api_error_formatted(self, cli_port: int, balatro_client: BalatroClient):
+    def test_api_error_formatted(self, port: int, balatro_client: BalatroClient):
         """API errors formatted as 'Error: NAME - message'."""
-        balatro_client.call("menu")
         result = runner.invoke(
-            app, ["api", "play", '{"cards": [0]}', "--port", str(cli_port)]
+            app, ["api", "play", '{"cards": [0]}', "--port", str(port)]
         )
         assert result.exit_code == 1
         assert "Error: INVALID_STATE" in result.output
@@ -90,9 +94,9 @@ class TestApiCommand:
 
     # --- Output format tests ---
 
-    def test_api_output_is_indented_json(self, cli_port: int):
+    def test_api_output_is_indented_json(self, port: int):
         """Output is pretty-printed JSON."""
-        result = runner.invoke(app, ["api", "health", "--port", str(cli_port)])
+        result = runner.invoke(app, ["api", "health", "--port", str(port)])
         assert result.exit_code == 0
         # Check for indentation (2 spaces) or compact format
         assert '  "status"' in result.output or '"status": "ok"' in result.output
@@ -3,7 +3,7 @@
 import httpx
 import pytest
 
-from balatrobot.cli.client import APIError, BalatroClient
+from balatrobot.cli.client import APIError, AsyncBalatroClient, BalatroClient
 
 
 class TestBalatroClient:
@@ -16,14 +16,11 @@ class TestBalatroClient:
 
     def test_gamestate_call_returns_state(self, balatro_client: BalatroClient):
         """Gamestate returns current state."""
-        # Reset to menu first
-        balatro_client.call("menu")
         result = balatro_client.call("gamestate")
         assert "state" in result
 
     def test_api_error_raised_on_invalid_state(self, balatro_client: BalatroClient):
         """APIError raised when action invalid for current state."""
-        balatro_client.call("menu")  # Ensure MENU state
         with pytest.raises(APIError) as exc_info:
             balatro_client.call("play", {"cards": [0]})
         assert exc_info.value.name == "INVALID_STATE"
@@ -35,13 +32,28 @@ class TestBalatroClient:
             balatro_client.call("start", {"invalid_param": "value"})
         assert exc_info.value.name == "BAD_REQUEST"
 
-    def test_request_id_increments(self, balatro_client: BalatroClient):
+    def test_request_id_increments(self, port: int):
         """Request ID increments with each call."""
-        assert balatro_client._request_id == 0
+        with BalatroClient(host="127.0.0.1", port=port) as client:
+            assert client._request_id == 0
+            client.call("health")
+            assert client._request_id == 1
+            client.call("health")
+            assert client._request_id == 2
+
+    def test_http_client_reused_across_calls(self, balatro_client: BalatroClient):
+        """The same httpx.Client is reused for consecutive calls."""
         balatro_client.call("health")
-        assert balatro_client._request_id == 1
+        http_client = balatro_client._client
         balatro_client.call("health")
-        assert balatro_client._request_id == 2
+        assert balatro_client._client is http_client
+
+    def test_context_manager_closes_client(self, port: int):
+        """Exiting the context manager closes the httpx.Client."""
+        with BalatroClient(host="127.0.0.1", port=port) as client:
+            client.call("health")
+            assert client._client is not None
+        assert client._client is None
 
     def test_url_property(self):
         """URL property formats correctly."""
@@ -53,3 +65,40 @@ class TestBalatroClient:
         client = BalatroClient(host="127.0.0.1", port=1, timeout=1.0)
         with pytest.raises(httpx.ConnectError):
             client.call("health")
+
+
+class TestAsyncBalatroClient:
+    """Test AsyncBalatroClient against real Balatro server."""
+
+    @pytest.mark.asyncio
+    async def test_health_call_returns_result(self, port: int):
+        """Health endpoint returns result dict."""
+        async with AsyncBalatroClient(host="127.0.0.1", port=port) as client:
+            result = await client.call("health")
+        assert result["status"] == "ok"
+
+    @pytest.mark.asyncio
+    async def test_call_many_returns_results_in_order(self, port: int):
+        """call_many returns one result per call, in call order."""
+        async with AsyncBalatroClient(host="127.0.0.1", port=port) as client:
+            results = await client.call_many(
+                [("menu", None), ("gamestate", None), ("health", None)]
+            )
+        assert len(results) == 3
+        assert results[1]["state"] == "MENU"
+        assert results[2]["status"] == "ok"
+
+    @pytest.mark.asyncio
+    async def test_call_many_raises_api_error(self, port: int):
+        """APIError from any call propagates from call_many."""
+        async with AsyncBalatroClient(host="127.0.0.1", port=port) as client:
+            with pytest.raises(APIError) as exc_info:
+                await client.call_many([("menu", None), ("play", {"cards": [0]})])
+        assert exc_info.value.name == "INVALID_STATE"
+
+    @pytest.mark.asyncio
+    async def test_connection_error_on_bad_port(self):
+        """httpx.ConnectError raised when server not available."""
+        async with AsyncBalatroClient(host="127.0.0.1", port=1, timeout=1.0) as client:
+            with pytest.raises(httpx.ConnectError):
+                await client.call("health")
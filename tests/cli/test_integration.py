@@ -1,6 +1,6 @@
 """Integration tests for balatrobot (requires actual Balatro game)."""
 
-import random
+import socket
 
 import httpx
 import pytest
@@ -9,8 +9,10 @@ from balatrobot import BalatroInstance
 
 
 def _random_port() -> int:
-    """Get a random port in the test range."""
-    return random.randint(20000, 30000)
+    """Get a free port assigned by the OS."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
 
 
 @pytest.mark.integration
@@ -4,7 +4,9 @@ import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from typer.testing import CliRunner
 
+from balatrobot.cli import app
 from balatrobot.config import Config
 from balatrobot.manager import BalatroInstance
 
@@ -83,7 +85,7 @@ class TestBalatroInstanceStop:
         instance = BalatroInstance()
         mock_process = MagicMock()
         mock_process.terminate = MagicMock()
-        mock_process.wait = MagicMock(return_value=0)
+        mock_process.wait = AsyncMock(return_value=0)
         instance._process = mock_process
 
         await instance.stop()
@@ -98,7 +100,7 @@ class TestBalatroInstanceStop:
         mock_process = MagicMock()
         mock_process.terminate = MagicMock()
         mock_process.kill = MagicMock()
-        mock_process.wait = MagicMock(return_value=0)
+        mock_process.wait = AsyncMock(return_value=0)
         instance._process = mock_process
 
         # Make the first wait_for timeout, but second succeed
@@ -122,6 +124,46 @@ class TestBalatroInstanceStop:
         mock_process.terminate.assert_called_once()
         mock_process.kill.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_stop_already_exited(self):
+        """Stop returns quietly when the process has already exited."""
+        instance = BalatroInstance()
+        mock_process = MagicMock()
+        mock_process.terminate = MagicMock(side_effect=ProcessLookupError)
+        mock_process.wait = AsyncMock(return_value=0)
+        instance._process = mock_process
+
+        await instance.stop()
+
+        mock_process.kill.assert_not_called()
+        assert instance._process is None
+
+    @pytest.mark.asyncio
+    async def test_terminate_then_wait(self):
+        """terminate() only signals; wait() reaps the process."""
+        instance = BalatroInstance()
+        mock_process = MagicMock()
+        mock_process.wait = AsyncMock(return_value=0)
+        instance._process = mock_process
+
+        instance.terminate()
+
+        mock_process.terminate.assert_called_once()
+        mock_process.wait.assert_not_called()
+        assert instance._process is mock_process
+
+        await instance.wait()
+
+        mock_process.wait.assert_called_once()
+        assert instance._process is None
+
+    @pytest.mark.asyncio
+    async def test_terminate_and_wait_not_started(self):
+        """terminate() and wait() do nothing when not started."""
+        instance = BalatroInstance()
+        instance.terminate()
+        await instance.wait()
+
 
 class TestBalatroInstanceHealthCheck:
     """Tests for BalatroInstance._wait_for_health() method."""
@@ -142,6 +184,64 @@ class TestBalatroInstanceHealthCheck:
         with pytest.raises(RuntimeError, match="Health check failed"):
             await instance._wait_for_health(timeout=1.0)
 
+    @pytest.mark.asyncio
+    async def test_health_check_reuses_client(self, mock_httpx_fail):
+        """A single AsyncClient is shared by all health probes."""
+        import httpx
+
+        instance = BalatroInstance()
+
+        with pytest.raises(RuntimeError, match="Health check failed"):
+            await instance._wait_for_health(timeout=0.3)
+
+        httpx.AsyncClient.assert_called_once()  # type: ignore[attr-defined]
+
+    @pytest.mark.asyncio
+    async def test_health_check_shared_client(self, mock_httpx_fail):
+        """A caller-provided client is used instead of creating one."""
+        import httpx
+
+        instance = BalatroInstance()
+        shared = MagicMock()
+        response = MagicMock()
+        response.json.return_value = {"result": {"status": "ok"}}
+        shared.post = AsyncMock(return_value=response)
+
+        await instance._wait_for_health(timeout=1.0, client=shared)
+
+        shared.post.assert_called_once()
+        httpx.AsyncClient.assert_not_called()  # type: ignore[attr-defined]
+
+
+class TestBalatroInstanceWaitReady:
+    """Tests for BalatroInstance.wait_ready() method."""
+
+    @pytest.mark.asyncio
+    async def test_wait_ready_not_spawned(self):
+        """Raises RuntimeError when the process was never spawned."""
+        instance = BalatroInstance()
+
+        with pytest.raises(RuntimeError, match="Instance not started"):
+            await instance.wait_ready()
+
+    @pytest.mark.asyncio
+    async def test_wait_ready_stops_on_failure(self, mock_httpx_fail, monkeypatch):
+        """The instance is stopped when the health check fails."""
+        instance = BalatroInstance()
+        instance._process = MagicMock(pid=12345)
+
+        async def fail(*args, **kwargs):
+            raise RuntimeError("Health check failed")
+
+        monkeypatch.setattr(instance, "_wait_for_health", fail)
+        stop = AsyncMock()
+        monkeypatch.setattr(instance, "stop", stop)
+
+        with pytest.raises(RuntimeError, match="Check log file"):
+            await instance.wait_ready()
+
+        stop.assert_called_once()
+
 
 class TestBalatroInstanceContextManager:
     """Tests for BalatroInstance context manager protocol."""
@@ -153,6 +253,7 @@ class TestBalatroInstanceContextManager:
         mock_launcher = MagicMock()
         mock_process = MagicMock()
         mock_process.pid = 12345
+        mock_process.wait = AsyncMock(return_value=0)
 
         async def mock_start(config, session_dir):
             return mock_process
@@ -174,3 +275,23 @@ class TestBalatroInstanceContextManager:
 
         # After exit, process should be cleared
         assert instance._process is None
+
+
+class TestServeLifecycle:
+    """Tests for how `balatrobot serve` drives a BalatroInstance."""
+
+    def test_serve_returns_when_game_exits(self, monkeypatch):
+        """serve stops waiting and reports the exit code when the game exits."""
+        instance = MagicMock(port=12346)
+        instance.process.wait = AsyncMock(return_value=3)
+        instance.__aenter__ = AsyncMock(return_value=instance)
+        instance.__aexit__ = AsyncMock(return_value=None)
+        monkeypatch.setattr(
+            "balatrobot.manager.BalatroInstance", MagicMock(return_value=instance)
+        )
+
+        result = CliRunner().invoke(app, ["serve"])
+
+        assert result.exit_code == 1
+        assert "Balatro exited with code 3" in result.output
+        instance.__aexit__.assert_called_once()
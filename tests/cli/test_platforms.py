@@ -1,13 +1,15 @@
 """Tests for balatrobot.platforms module."""
 
+import os
 import platform as platform_module
+from pathlib import Path
 
 import pytest
 
 from balatrobot.config import Config
 from balatrobot.platforms import VALID_PLATFORMS, get_launcher
 from balatrobot.platforms.macos import MacOSLauncher
-from balatrobot.platforms.native import NativeLauncher
+from balatrobot.platforms.native import NativeLauncher, _detect_love_path
 from balatrobot.platforms.windows import WindowsLauncher
 
 IS_MACOS = platform_module.system() == "Darwin"
@@ -130,6 +132,44 @@ class TestNativeLauncher:
 
         assert cmd == ["/usr/bin/love", "/path/to/balatro"]
 
+    def test_detect_love_path_cached(self, monkeypatch):
+        """PATH is only searched once for the love executable."""
+        calls = []
+
+        def fake_which(name):
+            calls.append(name)
+            return "/usr/bin/love"
+
+        monkeypatch.setattr("shutil.which", fake_which)
+        monkeypatch.setattr("balatrobot.platforms.native._love_path", None)
+
+        assert _detect_love_path() == _detect_love_path() == Path("/usr/bin/love")
+        assert calls == ["love"]
+
+    def test_detect_love_path_retries_miss(self, monkeypatch):
+        """A failed lookup is not cached, so a later install is found."""
+        found = iter([None, "/usr/bin/love"])
+        monkeypatch.setattr("shutil.which", lambda name: next(found))
+        monkeypatch.setattr("balatrobot.platforms.native._love_path", None)
+
+        assert _detect_love_path() is None
+        assert _detect_love_path() == Path("/usr/bin/love")
+
+    async def test_start_log_file_not_executable(self, tmp_path, monkeypatch):
+        """The log file is created with the same mode as open(path, "w")."""
+        launcher = NativeLauncher()
+        monkeypatch.setattr(launcher, "validate_paths", lambda config: None)
+        monkeypatch.setattr(launcher, "build_cmd", lambda config: ["true"])
+        config = Config(port=12399, lovely_path="/nonexistent/liblovely.so")
+
+        process = await launcher.start(config, tmp_path)
+        await process.wait()
+
+        umask = os.umask(0)
+        os.umask(umask)
+        mode = (tmp_path / "12399.log").stat().st_mode & 0o777
+        assert mode == 0o666 & ~umask
+
 
 @pytest.mark.skipif(not IS_WINDOWS, reason="Windows only")
 class TestWindowsLauncher:
@@ -1,13 +1,25 @@
 """Integration tests for balatrobot serve command."""
 
+import pytest
 from typer.testing import CliRunner
 
 from balatrobot.cli import app
 from balatrobot.cli.serve import PLATFORM_CHOICES
+from balatrobot.config import Config
 
 runner = CliRunner()
 
 
+@pytest.fixture(scope="module")
+def help_outputs():
+    """Help output depends only on the app definition, so render it once."""
+    return {
+        "serve": runner.invoke(app, ["serve", "--help"]),
+        "main": runner.invoke(app, ["--help"]),
+        "none": runner.invoke(app, []),
+    }
+
+
 class TestServeCommand:
     """Test balatrobot serve command options."""
 
@@ -26,9 +38,9 @@ class TestServeCommand:
 
     # --- Help text tests ---
 
-    def test_serve_help(self):
+    def test_serve_help(self, help_outputs):
         """serve --help shows all options."""
-        result = runner.invoke(app, ["serve", "--help"])
+        result = help_outputs["serve"]
         assert result.exit_code == 0
         assert "--host" in result.output
         assert "--port" in result.output
@@ -38,50 +50,52 @@ class TestServeCommand:
 
     # --- Config.from_kwargs tests ---
 
-    def test_config_from_kwargs_explicit_overrides_env(self, clean_env, monkeypatch):
-        """Explicit kwarg overrides environment variable."""
-        from balatrobot.config import Config
-
-        monkeypatch.setenv("BALATROBOT_HOST", "env-host")
-
-        config = Config.from_kwargs(host="cli-host", port=None)
-        assert config.host == "cli-host"
-
-    def test_config_from_kwargs_falls_back_to_env(self, clean_env, monkeypatch):
-        """None kwarg falls back to environment variable."""
-        from balatrobot.config import Config
-
-        monkeypatch.setenv("BALATROBOT_HOST", "env-host")
-
-        config = Config.from_kwargs(host=None, port=9999)
-        assert config.host == "env-host"
-        assert config.port == 9999
-
-    def test_config_from_kwargs_env_var_fallback(self, clean_env, monkeypatch):
-        """Env vars used when options not provided."""
-        from balatrobot.config import Config
-
-        monkeypatch.setenv("BALATROBOT_FAST", "1")
-        monkeypatch.setenv("BALATROBOT_PORT", "8888")
-
-        config = Config.from_kwargs(fast=None, port=None)
-        assert config.fast is True
-        assert config.port == 8888
+    @pytest.mark.parametrize(
+        "env,kwargs,expected",
+        [
+            pytest.param(
+                {"BALATROBOT_HOST": "env-host"},
+                {"host": "cli-host", "port": None},
+                {"host": "cli-host"},
+                id="explicit_overrides_env",
+            ),
+            pytest.param(
+                {"BALATROBOT_HOST": "env-host"},
+                {"host": None, "port": 9999},
+                {"host": "env-host", "port": 9999},
+                id="falls_back_to_env",
+            ),
+            pytest.param(
+                {"BALATROBOT_FAST": "1", "BALATROBOT_PORT": "8888"},
+                {"fast": None, "port": None},
+                {"fast": True, "port": 8888},
+                id="env_var_fallback",
+            ),
+        ],
+    )
+    def test_config_from_kwargs(self, clean_env, monkeypatch, env, kwargs, expected):
+        """Explicit kwargs win; None kwargs fall back to environment variables."""
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+
+        config = Config.from_kwargs(**kwargs)
+        for field, value in expected.items():
+            assert getattr(config, field) == value
 
 
 class TestMainApp:
     """Test main app help and structure."""
 
-    def test_main_help(self):
+    def test_main_help(self, help_outputs):
         """Main app --help shows subcommands."""
-        result = runner.invoke(app, ["--help"])
+        result = help_outputs["main"]
         assert result.exit_code == 0
         assert "serve" in result.output
         assert "api" in result.output
 
-    def test_no_args_shows_help(self):
+    def test_no_args_shows_help(self, help_outputs):
         """Running without args shows help (exit code 2 for multi-command apps)."""
-        result = runner.invoke(app, [])
+        result = help_outputs["none"]
         # Typer no_args_is_help exits with code 2 for multi-command apps
         assert result.exit_code == 2
         assert "serve" in result.output
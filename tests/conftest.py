@@ -1,6 +1,191 @@
-"""Root test configuration."""
+"""Root test configuration and shared Balatro instance management."""
+
+import asyncio
+import os
+import re
+import socket
+import time
+
+import httpx
+import pytest
+
+from balatrobot.config import Config
+from balatrobot.manager import BalatroInstance
+
+try:
+    import uvloop
+except ImportError:  # Optional: the stdlib loop is used when it's not installed
+    uvloop = None
+
+# ============================================================================
+# Constants
+# ============================================================================
+
+HOST = "127.0.0.1"
+
+
+# ============================================================================
+# Helpers
+# ============================================================================
+
+
+def _free_ports(n: int) -> list[int]:
+    """Ask the OS for n distinct free TCP ports."""
+    socks = [socket.socket() for _ in range(n)]
+    try:
+        for sock in socks:
+            sock.bind((HOST, 0))
+        return [sock.getsockname()[1] for sock in socks]
+    finally:
+        for sock in socks:
+            sock.close()
+
+
+# ============================================================================
+# Pytest Hooks for Balatro Instance Management
+# ============================================================================
+
+
+def _start_instances(config, parallel: int) -> None:
+    """Start `parallel` Balatro instances and publish their ports."""
+    # Let the OS pick free ports instead of guessing from a range
+    ports = _free_ports(parallel)
+
+    os.environ["BALATROBOT_PORTS"] = ",".join(str(p) for p in ports)
+
+    config._balatro_ports = ports
+    config._balatro_parallel = parallel
+
+    # Start instances
+    base_config = Config.from_env()
+    instances: list[BalatroInstance] = []
+
+    # One session directory shared by every instance's log file
+    session_id = time.strftime("%Y-%m-%dT%H-%M-%S")
+
+    async def start_all():
+        for port in ports:
+            instances.append(
+                BalatroInstance(base_config, session_id=session_id, port=port)
+            )
+        # Launch every process before probing, so boot times overlap. Task
+        # groups cancel the siblings of a failed task, so nothing is still
+        # running against the shared client (or the instances) afterwards.
+        async with asyncio.TaskGroup() as tg:
+            for inst in instances:
+                tg.create_task(inst.spawn())
+        async with httpx.AsyncClient(timeout=2.0) as client:
+            async with asyncio.TaskGroup() as tg:
+                for inst in instances:
+                    tg.create_task(inst.wait_ready(client))
+        print(f"All {parallel} Balatro instance(s) started on ports: {ports}")
+
+    # Instances are bound to the event loop that started them, so keep one
+    # loop for the whole session and reuse it in pytest_unconfigure.
+    runner = asyncio.Runner(loop_factory=uvloop.new_event_loop if uvloop else None)
+    config._balatro_runner = runner
+
+    try:
+        runner.run(start_all())
+        config._balatro_instances = instances
+    except Exception as e:
+        # Report the first failure rather than the task group wrapping it
+        cause = e.exceptions[0] if isinstance(e, ExceptionGroup) else e
+
+        async def cleanup():
+            for instance in instances:
+                instance.terminate()
+            await asyncio.gather(*[instance.wait() for instance in instances])
+
+        runner.run(cleanup())
+        runner.close()
+        raise pytest.UsageError(f"Could not start Balatro instances: {cause}") from e
+
+
+def _deselects_integration(markexpr: str) -> bool:
+    """Return True if a -m expression rules out every integration test.
+
+    Only plain conjunctions are recognised, e.g. "not integration" or
+    "not integration and not dev". Anything else may select integration tests,
+    so instances are started for it.
+    """
+    if "(" in markexpr or re.search(r"\bor\b", markexpr):
+        return False
+    terms = (" ".join(term.split()) for term in re.split(r"\band\b", markexpr))
+    return "not integration" in terms
 
 
 def pytest_configure(config):
-    """Register custom markers."""
+    """Register custom markers and start Balatro instances for xdist runs.
+
+    One set of instances serves both tests/cli and tests/lua. Their ports are
+    published to xdist workers through the BALATROBOT_PORTS env var, so under
+    xdist they must be up before the workers are spawned. Without xdist,
+    startup waits for pytest_collection_finish.
+    """
     config.addinivalue_line("markers", "integration: marks tests as integration tests")
+
+    # Skip if running as xdist worker (master handles startup)
+    if os.environ.get("PYTEST_XDIST_WORKER") is not None:
+        return
+
+    numprocesses = getattr(config.option, "numprocesses", None)
+    if not numprocesses:
+        return
+
+    # The xdist master never sees collected items, so go by the -m expression
+    if _deselects_integration(config.option.markexpr):
+        return
+
+    _start_instances(config, numprocesses)
+
+
+def pytest_collection_finish(session):
+    """Start a Balatro instance if any selected test needs one (no xdist)."""
+    config = session.config
+    if os.environ.get("PYTEST_XDIST_WORKER") is not None:
+        return
+    if getattr(config.option, "numprocesses", None) or config.option.collectonly:
+        return
+
+    if any(item.get_closest_marker("integration") for item in session.items):
+        _start_instances(config, 1)
+
+
+def pytest_unconfigure(config):
+    """Stop Balatro instances after tests complete."""
+    instances = getattr(config, "_balatro_instances", None)
+    if instances is None:
+        return
+
+    async def stop_all():
+        # Signal every instance first so their shutdowns overlap
+        for instance in instances:
+            instance.terminate()
+        await asyncio.gather(*[instance.wait() for instance in instances])
+
+    runner = config._balatro_runner
+    try:
+        runner.run(stop_all())
+    except Exception as e:
+        print(f"Error stopping Balatro instances: {e}")
+    finally:
+        runner.close()
+
+
+# ============================================================================
+# Session-scoped Fixtures
+# ============================================================================
+
+
+@pytest.fixture(scope="session")
+def port(worker_id) -> int:
+    """Get assigned port for this worker from env var."""
+    ports_str = os.environ.get("BALATROBOT_PORTS", "12346")
+    ports = [int(p) for p in ports_str.split(",")]
+
+    if worker_id == "master":
+        return ports[0]
+
+    worker_num = int(worker_id.replace("gw", ""))
+    return ports[worker_num]
@@ -1,19 +1,37 @@
 #!/usr/bin/env python3
 
+import argparse
+import asyncio
+import functools
+import hashlib
+import itertools
 import json
+import os
+import shutil
+import tempfile
 from collections import defaultdict
-from dataclasses import dataclass
+from collections.abc import Iterator
+from dataclasses import dataclass, field
 from pathlib import Path
 
 import httpx
-from tqdm import tqdm
+
+try:
+    import uvloop
+except ImportError:  # Optional: the stdlib loop is used when it's not installed
+    uvloop = None
 
 FIXTURES_DIR = Path(__file__).parent
+CACHE_DIR = FIXTURES_DIR / ".cache"
+REPO_DIR = FIXTURES_DIR.parent.parent
 HOST = "127.0.0.1"
 PORT = 12346
 
 # JSON-RPC 2.0 request ID counter
-_request_id: int = 0
+_request_ids = itertools.count(1)
+
+# Names for branch-point snapshots within a run
+_snapshot_ids = itertools.count()
 
 
 @dataclass
@@ -22,19 +40,16 @@ class FixtureSpec:
     setup: list[tuple[str, dict]]
 
 
-def api(client: httpx.Client, method: str, params: dict) -> dict:
+async def api(client: httpx.AsyncClient, method: str, params: dict) -> dict:
     """Send a JSON-RPC 2.0 request to BalatroBot."""
-    global _request_id
-    _request_id += 1
-
     payload = {
         "jsonrpc": "2.0",
         "method": method,
         "params": params,
-        "id": _request_id,
+        "id": next(_request_ids),
     }
 
-    response = client.post("/", json=payload)
+    response = await client.post("/", json=payload)
     response.raise_for_status()
     data = response.json()
 
@@ -87,81 +102,328 @@ def aggregate_fixtures(json_data: dict) -> list[FixtureSpec]:
     return fixtures
 
 
-def generate_fixture(client: httpx.Client, spec: FixtureSpec, pbar: tqdm) -> bool:
-    primary_path = spec.paths[0]
-    relative_path = primary_path.relative_to(FIXTURES_DIR)
+@dataclass
+class SetupNode:
+    """Node of the setup prefix trie: the game state after `step`."""
 
-    try:
+    step: tuple[str, dict] | None = None
+    children: dict[str, "SetupNode"] = field(default_factory=dict)
+    specs: list[FixtureSpec] = field(default_factory=list)
+
+    def iter_specs(self) -> Iterator[FixtureSpec]:
+        yield from self.specs
+        for child in self.children.values():
+            yield from child.iter_specs()
+
+
+def build_setup_trie(fixtures: list[FixtureSpec]) -> SetupNode:
+    """Merge fixture setups that share a prefix of API calls."""
+    root = SetupNode()
+    for spec in fixtures:
+        node = root
         for method, params in spec.setup:
-            response = api(client, method, params)
-            if isinstance(response, dict) and "error" in response:
-                error_msg = response["error"].get("message", str(response["error"]))
-                pbar.write(f"  Error: {relative_path} - {error_msg}")
-                return False
+            key = json.dumps([method, params], sort_keys=True, separators=(",", ":"))
+            if key not in node.children:
+                node.children[key] = SetupNode(step=(method, params))
+            node = node.children[key]
+        node.specs.append(spec)
+    return root
+
+
+def split_work(
+    root: SetupNode, parts: int
+) -> list[tuple[list[tuple[str, dict]], SetupNode]]:
+    """Split the trie into roughly `parts` balanced work items.
+
+    Each item is the setup path to a subtree plus the subtree itself. The
+    largest subtree is split until no item holds more than its fair share
+    of fixtures.
+    """
+
+    def size(item: tuple[list[tuple[str, dict]], SetupNode]) -> int:
+        return sum(1 for _ in item[1].iter_specs())
+
+    share = size(([], root)) / parts
+    items: list[tuple[list[tuple[str, dict]], SetupNode]] = [([], root)]
+    while True:
+        items.sort(key=size)
+        path, node = items[-1]
+        if size(items[-1]) <= share or not node.children:
+            break
+        items.pop()
+        if node.specs:
+            items.append((path, SetupNode(step=node.step, specs=node.specs)))
+        for child in node.children.values():
+            assert child.step is not None
+            items.append((path + [child.step], child))
+    return items
+
+
+def link_or_copy(src: Path, dest: Path) -> None:
+    """Hard-link `src` to `dest`, copying where links aren't supported."""
+    dest.unlink(missing_ok=True)
+    try:
+        os.link(src, dest)
+    except OSError:
+        shutil.copyfile(src, dest)
+
+
+@functools.cache
+def mod_fingerprint() -> str:
+    """Hash of the mod's sources, so cached saves expire when the mod changes."""
+    digest = hashlib.sha256()
+    sources = [REPO_DIR / "balatrobot.json", REPO_DIR / "balatrobot.lua"]
+    sources += sorted(p for p in (REPO_DIR / "src" / "lua").rglob("*") if p.is_file())
+    for path in sources:
+        digest.update(str(path.relative_to(REPO_DIR)).encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def cache_path(spec: FixtureSpec) -> Path:
+    """Cache entry for a setup, keyed by the mod sources and its API calls."""
+    key = json.dumps(spec.setup, sort_keys=True, separators=(",", ":"))
+    digest = hashlib.sha256(f"{mod_fingerprint()}\n{key}".encode()).hexdigest()
+    return CACHE_DIR / f"{digest}.jkr"
+
+
+def restore_cached(spec: FixtureSpec) -> bool:
+    """Copy a cached save to every path of `spec`; return False on a miss."""
+    cached = cache_path(spec)
+    if not cached.exists():
+        return False
+    for dest_path in spec.paths:
+        link_or_copy(cached, dest_path)
+    return True
+
+
+def store_cached(spec: FixtureSpec) -> None:
+    """Record the freshly saved primary path of `spec` in the cache."""
+    link_or_copy(spec.paths[0], cache_path(spec))
+
+
+class Progress:
+    """Print one line per finished fixture."""
+
+    def __init__(self, total: int) -> None:
+        self.total = total
+        self.done = 0
 
-        primary_path.parent.mkdir(parents=True, exist_ok=True)
-        response = api(client, "save", {"path": str(primary_path)})
+    def report(self, spec: FixtureSpec, error: str | None = None) -> None:
+        self.done += 1
+        relative_path = spec.paths[0].relative_to(FIXTURES_DIR)
+        if error is None:
+            print(f"[{self.done}/{self.total}] {relative_path}")
+        else:
+            print(f"[{self.done}/{self.total}] Error: {relative_path} - {error}")
+
+
+async def save_fixture(
+    client: httpx.AsyncClient, spec: FixtureSpec, progress: Progress
+) -> bool:
+    """Save the current game state to every path of `spec`."""
+    primary_path = spec.paths[0]
+    # Save next to the old file and swap it in, so a failed save keeps the old
+    # fixture and a hard link into the cache is never written through
+    temp_path = primary_path.with_suffix(".tmp.jkr")
+
+    try:
+        temp_path.unlink(missing_ok=True)
+        response = await api(client, "save", {"path": str(temp_path)})
         if isinstance(response, dict) and "error" in response:
             error_msg = response["error"].get("message", str(response["error"]))
-            pbar.write(f"  Error: {relative_path} - {error_msg}")
+            progress.report(spec, error_msg)
             return False
+        os.replace(temp_path, primary_path)
 
         for dest_path in spec.paths[1:]:
-            dest_path.parent.mkdir(parents=True, exist_ok=True)
-            dest_path.write_bytes(primary_path.read_bytes())
-
-        return True
+            link_or_copy(primary_path, dest_path)
+        store_cached(spec)
 
     except Exception as e:
-        pbar.write(f"  Error: {relative_path} failed: {e}")
+        progress.report(spec, f"failed: {e}")
         return False
+    finally:
+        temp_path.unlink(missing_ok=True)
 
+    progress.report(spec)
+    return True
 
-def main() -> int:
-    print("BalatroBot Fixture Generator")
-    print(f"Connecting to {HOST}:{PORT}\n")
+
+async def run_steps(
+    client: httpx.AsyncClient, steps: list[tuple[str, dict]]
+) -> str | None:
+    """Run API calls in order; return the first error message, if any."""
+    try:
+        for method, params in steps:
+            response = await api(client, method, params)
+            if isinstance(response, dict) and "error" in response:
+                return response["error"].get("message", str(response["error"]))
+    except Exception as e:
+        return f"failed: {e}"
+    return None
+
+
+async def generate_subtree(
+    client: httpx.AsyncClient,
+    node: SetupNode,
+    restore: list[tuple[str, dict]],
+    snapshot_dir: Path,
+    progress: Progress,
+) -> int:
+    """Generate every fixture below `node`, whose state the game is in.
+
+    `restore` is the list of calls that brings the game back to this state.
+    Returns the number of failed fixtures.
+    """
+    failed = 0
+    saved: Path | None = None
+    for spec in node.specs:
+        if await save_fixture(client, spec, progress):
+            saved = spec.paths[0]
+        else:
+            failed += 1
+
+    # A stable order; the first child continues from the live state
+    children = [node.children[key] for key in sorted(node.children)]
+    if len(children) > 1:
+        # Snapshot the branch point so each later child starts from a single
+        # load instead of replaying the whole shared prefix
+        if saved is None:
+            # Not every state can be saved (e.g. the menu); then keep replaying
+            snapshot = snapshot_dir / f"{next(_snapshot_ids)}.jkr"
+            if await run_steps(client, [("save", {"path": str(snapshot)})]) is None:
+                saved = snapshot
+        if saved is not None:
+            restore = [("load", {"path": str(saved)})]
+        elif not restore:
+            # At the root there is no prefix to replay; start siblings afresh
+            restore = [("menu", {})]
+
+    for i, child in enumerate(children):
+        assert child.step is not None
+        steps = [child.step]
+        if i > 0:
+            steps = restore + steps
+        error = await run_steps(client, steps)
+        if error is not None:
+            for spec in child.iter_specs():
+                progress.report(spec, error)
+                failed += 1
+            continue
+        failed += await generate_subtree(
+            client, child, restore + [child.step], snapshot_dir, progress
+        )
+
+    return failed
+
+
+async def worker(
+    client: httpx.AsyncClient,
+    queue: asyncio.Queue[tuple[list[tuple[str, dict]], SetupNode]],
+    snapshot_dir: Path,
+    progress: Progress,
+) -> int:
+    """Generate subtrees from the queue on one instance; return failure count."""
+    failed = 0
+    while not queue.empty():
+        path, node = queue.get_nowait()
+        error = await run_steps(client, path)
+        if error is not None:
+            for spec in node.iter_specs():
+                progress.report(spec, error)
+                failed += 1
+            continue
+        failed += await generate_subtree(client, node, path, snapshot_dir, progress)
+    await api(client, "menu", {})
+    return failed
+
+
+async def run(ports: list[int], use_cache: bool = True) -> int:
+    print("BalatroBot Fixture Generator\n")
 
     json_data = load_fixtures_json()
     fixtures = aggregate_fixtures(json_data)
     print(f"Loaded {len(fixtures)} unique fixture configurations\n")
 
-    try:
-        with httpx.Client(
-            base_url=f"http://{HOST}:{PORT}",
+    # Create every output directory once instead of before each write
+    directories = {path.parent for spec in fixtures for path in spec.paths}
+    for directory in directories | {CACHE_DIR}:
+        directory.mkdir(parents=True, exist_ok=True)
+
+    missing = fixtures
+    if use_cache:
+        missing = [spec for spec in fixtures if not restore_cached(spec)]
+        print(f"Reused {len(fixtures) - len(missing)} cached configurations\n")
+
+    # The corrupted save is written directly, without the game
+    corrupt_file(FIXTURES_DIR / "load" / "corrupted.jkr")
+
+    # Nothing to generate: don't connect to the game at all
+    if not missing:
+        print(f"Summary: {len(fixtures) + 1} generated, 0 failed")
+        return 0
+
+    print(f"Connecting to {HOST} on ports {', '.join(map(str, ports))}\n")
+
+    # Work items carry their full setup path, so any instance can take any
+    queue: asyncio.Queue[tuple[list[tuple[str, dict]], SetupNode]] = asyncio.Queue()
+    for item in split_work(build_setup_trie(missing), parts=len(ports)):
+        queue.put_nowait(item)
+
+    clients = [
+        httpx.AsyncClient(
+            base_url=f"http://{HOST}:{port}",
             timeout=httpx.Timeout(60.0, read=10.0),
-        ) as client:
-            success = 0
-            failed = 0
-
-            with tqdm(
-                total=len(fixtures), desc="Generating fixtures", unit="fixture"
-            ) as pbar:
-                for spec in fixtures:
-                    if generate_fixture(client, spec, pbar):
-                        success += 1
-                    else:
-                        failed += 1
-                    pbar.update(1)
-
-            api(client, "menu", {})
-
-            corrupted_path = FIXTURES_DIR / "load" / "corrupted.jkr"
-            corrupt_file(corrupted_path)
-            success += 1
-
-            print(f"\nSummary: {success} generated, {failed} failed")
-            return 1 if failed > 0 else 0
-
-    except httpx.ConnectError:
-        print(f"Error: Could not connect to Balatro at {HOST}:{PORT}")
+        )
+        for port in ports
+    ]
+    try:
+        progress = Progress(total=len(missing))
+        with tempfile.TemporaryDirectory(prefix="balatrobot-fixtures-") as tmp:
+            snapshot_dir = Path(tmp)
+            failures = await asyncio.gather(
+                *(worker(client, queue, snapshot_dir, progress) for client in clients)
+            )
+        failed = sum(failures)
+        success = len(fixtures) + 1 - failed
+
+        print(f"\nSummary: {success} generated, {failed} failed")
+        return 1 if failed > 0 else 0
+
+    except httpx.ConnectError as e:
+        print(f"Error: Could not connect to Balatro at {e.request.url}")
         print("Make sure Balatro is running with BalatroBot mod loaded")
         return 1
-    except httpx.TimeoutException:
-        print(f"Error: Connection timeout to Balatro at {HOST}:{PORT}")
+    except httpx.TimeoutException as e:
+        print(f"Error: Connection timeout to Balatro at {e.request.url}")
         return 1
     except Exception as e:
         print(f"Error: {e}")
         return 1
+    finally:
+        for client in clients:
+            await client.aclose()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Generate BalatroBot test fixtures")
+    parser.add_argument(
+        "--ports",
+        default=str(PORT),
+        help=f"Comma-separated ports of running Balatro instances (default: {PORT})",
+    )
+    parser.add_argument(
+        "--no-caches",
+        action="store_true",
+        help="Ignore cached fixtures and regenerate all of them",
+    )
+    args = parser.parse_args()
+    ports = [int(p) for p in args.ports.split(",")]
+    return asyncio.run(
+        run(ports, use_cache=not args.no_caches),
+        loop_factory=uvloop.new_event_loop if uvloop else None,
+    )
 
 
 if __name__ == "__main__":
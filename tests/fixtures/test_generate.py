@@ -0,0 +1,154 @@
+"""Unit tests for the fixture generator's setup trie and replay."""
+
+from pathlib import Path
+
+from tests.fixtures import generate
+from tests.fixtures.generate import (
+    FIXTURES_DIR,
+    FixtureSpec,
+    Progress,
+    SetupNode,
+    build_setup_trie,
+    generate_subtree,
+    split_work,
+)
+
+START = ("start", {"deck": "RED", "stake": "WHITE"})
+SELECT = ("select", {})
+SKIP = ("skip", {})
+PLAY = ("play", {"cards": [0]})
+DISCARD = ("discard", {"cards": [0]})
+
+
+def spec(name: str, *setup: tuple[str, dict]) -> FixtureSpec:
+    return FixtureSpec(paths=[Path(f"{name}.jkr")], setup=list(setup))
+
+
+def names(node: SetupNode) -> list[str]:
+    return sorted(s.paths[0].stem for s in node.iter_specs())
+
+
+class TestBuildSetupTrie:
+    """Test merging fixture setups into a prefix trie."""
+
+    def test_shared_prefix_merged(self):
+        """Setups sharing calls share the trie nodes for those calls."""
+        root = build_setup_trie(
+            [spec("a", START, SELECT, PLAY), spec("b", START, SELECT, DISCARD)]
+        )
+
+        assert len(root.children) == 1
+        (start,) = root.children.values()
+        assert start.step == START
+        (select,) = start.children.values()
+        assert select.step == SELECT
+        assert sorted(c.step[0] for c in select.children.values()) == [
+            "discard",
+            "play",
+        ]
+
+    def test_node_with_specs_and_children(self):
+        """A setup that is a prefix of another ends on an inner node."""
+        root = build_setup_trie(
+            [spec("a", START), spec("b", START, SELECT), spec("c", START, SKIP)]
+        )
+
+        (start,) = root.children.values()
+        assert [s.paths[0].stem for s in start.specs] == ["a"]
+        assert len(start.children) == 2
+        assert names(start) == ["a", "b", "c"]
+
+    def test_param_key_order_ignored(self):
+        """Calls with the same params in a different order are one node."""
+        root = build_setup_trie(
+            [
+                spec("a", ("start", {"deck": "RED", "stake": "WHITE"})),
+                spec("b", ("start", {"stake": "WHITE", "deck": "RED"})),
+            ]
+        )
+
+        (start,) = root.children.values()
+        assert names(start) == ["a", "b"]
+        assert not start.children
+
+
+class TestSplitWork:
+    """Test splitting the trie into work items for several instances."""
+
+    def test_single_part_is_whole_trie(self):
+        """One instance gets the root with an empty setup path."""
+        root = build_setup_trie([spec("a", START, SELECT), spec("b", START, SKIP)])
+
+        assert split_work(root, parts=1) == [([], root)]
+
+    def test_split_is_balanced_and_complete(self):
+        """Every fixture lands in exactly one item, none above its share."""
+        fixtures = [
+            spec("a", START),
+            spec("b", START, SELECT, PLAY),
+            spec("c", START, SELECT, DISCARD),
+            spec("d", START, SKIP),
+            spec("e", START, SKIP, SELECT),
+            spec("f", START, SKIP, SELECT, PLAY),
+        ]
+        root = build_setup_trie(fixtures)
+
+        items = split_work(root, parts=3)
+
+        assert sorted(n for _, node in items for n in names(node)) == list("abcdef")
+        assert all(len(names(node)) <= len(fixtures) / 3 for _, node in items)
+
+    def test_items_carry_their_setup_path(self):
+        """Each item's path replays the calls leading to its subtree."""
+        fixtures = [
+            spec("a", START),
+            spec("b", START, SELECT, PLAY),
+            spec("c", START, SELECT, DISCARD),
+            spec("d", START, SKIP),
+        ]
+        by_name = {f.paths[0].stem: f for f in fixtures}
+
+        for path, node in split_work(build_setup_trie(fixtures), parts=4):
+            for s in node.specs:
+                assert path == by_name[s.paths[0].stem].setup
+            for s in node.iter_specs():
+                assert by_name[s.paths[0].stem].setup[: len(path)] == path
+
+    def test_branch_specs_split_off(self):
+        """Specs on a split branch node become an item without children."""
+        root = build_setup_trie(
+            [spec("a", START), spec("b", START, SELECT), spec("c", START, SKIP)]
+        )
+
+        items = split_work(root, parts=3)
+
+        specs_only = [node for _, node in items if names(node) == ["a"]]
+        assert len(specs_only) == 1
+        assert not specs_only[0].children
+
+
+class TestGenerateSubtree:
+    """Test replaying the trie against a game."""
+
+    async def test_root_siblings_start_from_menu(self, tmp_path, monkeypatch):
+        """Without a snapshot, later root children reset the game first."""
+        calls = []
+
+        async def fake_api(client, method, params):
+            calls.append(method)
+            if method == "save":
+                return {"error": {"message": "cannot save"}}
+            return {"result": {}}
+
+        monkeypatch.setattr(generate, "api", fake_api)
+        fixtures = [
+            FixtureSpec(paths=[FIXTURES_DIR / "a.jkr"], setup=[START]),
+            FixtureSpec(paths=[FIXTURES_DIR / "b.jkr"], setup=[SKIP]),
+        ]
+
+        failed = await generate_subtree(
+            None, build_setup_trie(fixtures), [], tmp_path, Progress(2)
+        )
+
+        assert failed == 2
+        assert calls == ["save", "skip", "save", "menu", "start", "save"]
@@ -1,19 +1,19 @@
 """Lua API test-specific configuration and fixtures."""
 
 import asyncio
+import functools
+import itertools
 import json
 import os
-import random
 import tempfile
 import uuid
 from pathlib import Path
-from typing import Any, AsyncGenerator, Generator
+from typing import Any, AsyncGenerator, Generator, Iterator
 
 import httpx
 import pytest
 
-from balatrobot.config import Config
-from balatrobot.manager import BalatroInstance
+from balatrobot.manager import HEALTH_POLL_MAX, HEALTH_POLL_MIN
 
 # ============================================================================
 # Constants
@@ -23,22 +23,26 @@ HOST: str = "127.0.0.1"  # Default host for Balatro server
 CONNECTION_TIMEOUT: float = 60.0  # Connection timeout in seconds
 REQUEST_TIMEOUT: float = 30.0  # Default per-request timeout in seconds
 
+# Path prefix of this directory, for cheap string checks during collection
+_DIR_PREFIX: str = str(Path(__file__).parent) + os.sep
+
+# Saved game states and their setup steps (fixtures.json)
+_FIXTURES_DIR: Path = Path(__file__).parent.parent / "fixtures"
+
 # JSON-RPC 2.0 request ID counter
-_request_id_counter: int = 0
+_request_ids: Iterator[int] = itertools.count(1)
 
 # Default cache behavior for load_fixture
 _USE_CACHE_DEFAULT: bool = True
 
 
-def _check_health(host: str, port: int, timeout: float = 2.0) -> bool:
-    """Sync health check for test fixtures."""
-    url = f"http://{host}:{port}"
+async def _check_health(client: httpx.AsyncClient, url: str) -> bool:
+    """Async health check for test fixtures."""
     payload = {"jsonrpc": "2.0", "method": "health", "params": {}, "id": 1}
     try:
-        with httpx.Client(timeout=timeout) as client:
-            response = client.post(url, json=payload)
-            data = response.json()
-            return "result" in data and data["result"].get("status") == "ok"
+        response = await client.post(url, json=payload)
+        data = response.json()
+        return "result" in data and data["result"].get("status") == "ok"
     except (httpx.ConnectError, httpx.TimeoutException):
         return False
 
@@ -54,78 +58,17 @@ def pytest_addoption(parser):
 
 
 def pytest_configure(config):
-    """Configure pytest and start Balatro instances."""
+    """Apply command line options for fixture caching."""
     global _USE_CACHE_DEFAULT
     if config.getoption("--no-caches", default=False):
         _USE_CACHE_DEFAULT = False
 
-    # Skip if running as xdist worker (master handles startup)
-    worker_id = os.environ.get("PYTEST_XDIST_WORKER")
-    if worker_id is not None:
-        return
-
-    # Determine parallelism
-    numprocesses = getattr(config.option, "numprocesses", None)
-    parallel = numprocesses if numprocesses and numprocesses > 0 else 1
-
-    # Allocate random ports
-    port_range_start = 12346
-    port_range_end = 23456
-    ports = random.sample(range(port_range_start, port_range_end), parallel)
-
-    os.environ["BALATROBOT_PORTS"] = ",".join(str(p) for p in ports)
-
-    config._balatro_ports = ports
-    config._balatro_parallel = parallel
-
-    # Start instances
-    base_config = Config.from_env()
-    instances: list[BalatroInstance] = []
-
-    async def start_all():
-        for port in ports:
-            instances.append(BalatroInstance(base_config, port=port))
-        await asyncio.gather(*[inst.start() for inst in instances])
-        print(f"All {parallel} Balatro instance(s) started on ports: {ports}")
-
-    try:
-        asyncio.run(start_all())
-        config._balatro_instances = instances
-    except Exception as e:
-
-        async def cleanup():
-            for instance in instances:
-                await instance.stop()
-
-        asyncio.run(cleanup())
-        raise pytest.UsageError(f"Could not start Balatro instances: {e}") from e
-
-
-def pytest_unconfigure(config):
-    """Stop Balatro instances after tests complete."""
-    instances = getattr(config, "_balatro_instances", None)
-    if instances is None:
-        return
-
-    async def stop_all():
-        for instance in instances:
-            await instance.stop()
-
-    try:
-        asyncio.run(stop_all())
-    except Exception as e:
-        print(f"Error stopping Balatro instances: {e}")
-
 
 def pytest_collection_modifyitems(items):
     """Mark all tests in this directory as integration tests."""
-    from pathlib import Path
-
-    current_dir = Path(__file__).parent
-
     for item in items:
         # Check if the test file is within the current directory
-        if current_dir in Path(item.path).parents:
+        if str(item.path).startswith(_DIR_PREFIX):
             item.add_marker(pytest.mark.integration)
 
 
@@ -135,51 +78,51 @@ def host() -> str:
     return HOST
 
 
-@pytest.fixture(scope="session")
-def port(worker_id) -> int:
-    """Get assigned port for this worker from env var."""
-    ports_str = os.environ.get("BALATROBOT_PORTS", "12346")
-    ports = [int(p) for p in ports_str.split(",")]
-
-    if worker_id == "master":
-        return ports[0]
-
-    worker_num = int(worker_id.replace("gw", ""))
-    return ports[worker_num]
-
-
 @pytest.fixture(scope="session")
 async def balatro_server(port: int, worker_id) -> AsyncGenerator[None, None]:
     """Wait for pre-started Balatro instance to be healthy."""
     timeout = 10.0
-    elapsed = 0.0
-    while elapsed < timeout:
-        if _check_health(HOST, port):
-            print(f"[{worker_id}] Connected to Balatro on port {port}")
-            yield None
-            return
-        await asyncio.sleep(0.5)
-        elapsed += 0.5
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    delay = HEALTH_POLL_MIN
+    healthy = False
+    async with httpx.AsyncClient(timeout=2.0) as client:
+        while loop.time() < deadline:
+            if await _check_health(client, f"http://{HOST}:{port}"):
+                healthy = True
+                break
+            await asyncio.sleep(delay)
+            delay = min(delay * 1.6, HEALTH_POLL_MAX)
+
+    if not healthy:
+        pytest.fail(f"Balatro instance on port {port} not responding")
+    print(f"[{worker_id}] Connected to Balatro on port {port}")
+    yield None
+
 
-    pytest.fail(f"Balatro instance on port {port} not responding")
+@pytest.fixture(scope="session")
+def _session_client(
+    host: str, port: int, balatro_server
+) -> Generator[httpx.Client, None, None]:
+    """HTTP client shared by every test on this worker."""
+    with httpx.Client(
+        base_url=f"http://{host}:{port}",
+        timeout=httpx.Timeout(CONNECTION_TIMEOUT, read=REQUEST_TIMEOUT),
+    ) as http_client:
+        yield http_client
 
 
 @pytest.fixture
-def client(host: str, port: int, balatro_server) -> Generator[httpx.Client, None, None]:
-    """Create an HTTP client connected to Balatro game instance.
+def client(_session_client: httpx.Client) -> httpx.Client:
+    """Return an HTTP client connected to the Balatro game instance.
 
-    Args:
-        host: The hostname or IP address of the Balatro game server.
-        port: The port number the Balatro game server is listening on.
+    The client is created once per session; building a new one per test
+    (SSL context, transport, pool) costs more than most requests it sends.
 
-    Yields:
+    Returns:
         An httpx.Client for communicating with the game.
     """
-    with httpx.Client(
-        base_url=f"http://{host}:{port}",
-        timeout=httpx.Timeout(CONNECTION_TIMEOUT, read=REQUEST_TIMEOUT),
-    ) as http_client:
-        yield http_client
+    return _session_client
 
 
 # ============================================================================
@@ -204,14 +147,11 @@ def api(
     Returns:
         The raw JSON-RPC 2.0 response with either 'result' or 'error' field.
     """
-    global _request_id_counter
-    _request_id_counter += 1
-
     payload = {
         "jsonrpc": "2.0",
         "method": method,
         "params": params,
-        "id": _request_id_counter,
+        "id": next(_request_ids),
     }
 
     response = client.post("/", json=payload, timeout=timeout)
@@ -238,10 +178,8 @@ def send_request(
     Returns:
         The HTTP response object.
     """
-    global _request_id_counter
     if request_id is None:
-        _request_id_counter += 1
-        request_id = _request_id_counter
+        request_id = next(_request_ids)
 
     request = {
         "jsonrpc": "2.0",
@@ -263,8 +201,7 @@ def get_fixture_path(endpoint: str, fixture_name: str) -> Path:
     Returns:
         Path to the fixture file in tests/fixtures/<endpoint>/.
     """
-    fixtures_dir = Path(__file__).parent.parent / "fixtures"
-    return fixtures_dir / endpoint / f"{fixture_name}.jkr"
+    return _FIXTURES_DIR / endpoint / f"{fixture_name}.jkr"
 
 
 def create_temp_save_path() -> Path:
@@ -277,6 +214,22 @@ def create_temp_save_path() -> Path:
     return temp_dir / f"balatrobot_test_{uuid.uuid4().hex[:8]}.jkr"
 
 
+def _api_checked(client: httpx.Client, method: str, params: dict) -> dict[str, Any]:
+    """Call `api` for a fixture setup step, raising if the game returns an error."""
+    response = api(client, method, params)
+    if "error" in response:
+        error_msg = response["error"]["message"]
+        raise AssertionError(f"Fixture generation failed at step {method}: {error_msg}")
+    return response
+
+
+@functools.lru_cache(maxsize=1)
+def _fixtures_json() -> dict[str, Any]:
+    """Parse fixtures.json once; callers must not modify the result."""
+    with open(_FIXTURES_DIR / "fixtures.json") as f:
+        return json.load(f)
+
+
 def load_fixture(
     client: httpx.Client,
     endpoint: str,
@@ -301,9 +254,7 @@ def load_fixture(
 
     # Generate fixture if it doesn't exist or cache=False
     if not fixture_path.exists() or not cache:
-        fixtures_json_path = Path(__file__).parent.parent / "fixtures" / "fixtures.json"
-        with open(fixtures_json_path) as f:
-            fixtures_data = json.load(f)
+        fixtures_data = _fixtures_json()
 
         if endpoint not in fixtures_data:
             raise KeyError(f"Endpoint '{endpoint}' not found in fixtures.json")
@@ -316,21 +267,20 @@ def load_fixture(
 
         # Execute each setup step
         for step in setup_steps:
-            step_method = step["method"]
-            step_params = step.get("params", {})
-            response = api(client, step_method, step_params)
-
-            # Check for errors during generation
-            if "error" in response:
-                error_msg = response["error"]["message"]
-                raise AssertionError(
-                    f"Fixture generation failed at step {step_method}: {error_msg}"
-                )
+            _api_checked(client, step["method"], step.get("params", {}))
 
         # Save the fixture
         fixture_path.parent.mkdir(parents=True, exist_ok=True)
-        save_response = api(client, "save", {"path": str(fixture_path)})
-        assert_path_response(save_response)
+        # Generated fixtures may share one hard-linked file, and a failed save
+        # must keep the old one: save aside, then swap it in
+        temp_path = fixture_path.with_suffix(".tmp.jkr")
+        try:
+            temp_path.unlink(missing_ok=True)
+            save_response = api(client, "save", {"path": str(temp_path)})
+            assert_path_response(save_response)
+            os.replace(temp_path, fixture_path)
+        finally:
+            temp_path.unlink(missing_ok=True)
 
     # Load the fixture
     load_response = api(client, "load", {"path": str(fixture_path)})
@@ -507,24 +457,20 @@ def assert_error_response(
     error = response["error"]
     assert "message" in error, f"ErrorResponse missing 'message': {error}"
     assert "data" in error, f"ErrorResponse missing 'data': {error}"
-    assert "name" in error["data"], f"ErrorResponse data missing 'name': {error}"
-    assert isinstance(error["message"], str), (
-        f"ErrorResponse 'message' not a string: {error}"
-    )
-    assert isinstance(error["data"]["name"], str), (
-        f"ErrorResponse 'name' not a string: {error}"
-    )
+    data = error["data"]
+    assert "name" in data, f"ErrorResponse data missing 'name': {error}"
+    message, name = error["message"], data["name"]
+    assert isinstance(message, str), f"ErrorResponse 'message' not a string: {error}"
+    assert isinstance(name, str), f"ErrorResponse 'name' not a string: {error}"
 
     if expected_error_name is not None:
-        actual_name = error["data"]["name"]
-        assert actual_name == expected_error_name, (
-            f"Expected error name '{expected_error_name}', got '{actual_name}'"
+        assert name == expected_error_name, (
+            f"Expected error name '{expected_error_name}', got '{name}'"
         )
 
     if expected_message_contains is not None:
-        actual_message = error["message"]
-        assert expected_message_contains.lower() in actual_message.lower(), (
-            f"Expected message to contain '{expected_message_contains}', got '{actual_message}'"
+        assert expected_message_contains.lower() in message.lower(), (
+            f"Expected message to contain '{expected_message_contains}', got '{message}'"
         )
 
-    return error["data"]
+    return data
@@ -9,12 +9,15 @@ Test classes are organized by validation tier:
 - TestDispatcherEndpointRegistry: Endpoint registration and discovery
 """
 
+import itertools
+
 import httpx
+import pytest
 
 from tests.lua.conftest import api
 
 # Request ID counter for malformed request tests only
-_test_request_id = 0
+_test_request_ids = itertools.count(1)
 
 
 class TestDispatcherProtocolValidation:
@@ -28,12 +31,10 @@ class TestDispatcherProtocolValidation:
 
     def test_missing_name_field(self, client: httpx.Client) -> None:
         """Test that requests without 'method' field are rejected."""
-        global _test_request_id
-        _test_request_id += 1
         # Send JSON-RPC request missing 'method' field
         response = client.post(
             "/",
-            json={"jsonrpc": "2.0", "params": {}, "id": _test_request_id},
+            json={"jsonrpc": "2.0", "params": {}, "id": next(_test_request_ids)},
         )
         parsed = response.json()
 
@@ -46,8 +47,6 @@ class TestDispatcherProtocolValidation:
 
     def test_invalid_name_type(self, client: httpx.Client) -> None:
         """Test that 'method' field must be a string."""
-        global _test_request_id
-        _test_request_id += 1
         # Send JSON-RPC request with 'method' as integer
         response = client.post(
             "/",
@@ -55,7 +54,7 @@ class TestDispatcherProtocolValidation:
                 "jsonrpc": "2.0",
                 "method": 123,
                 "params": {},
-                "id": _test_request_id,
+                "id": next(_test_request_ids),
             },
         )
         parsed = response.json()
@@ -65,12 +64,10 @@ class TestDispatcherProtocolValidation:
 
     def test_missing_arguments_field(self, client: httpx.Client) -> None:
         """Test that requests without 'params' field succeed (params is optional in JSON-RPC 2.0)."""
-        global _test_request_id
-        _test_request_id += 1
         # Send JSON-RPC request without 'params' field
         response = client.post(
             "/",
-            json={"jsonrpc": "2.0", "method": "health", "id": _test_request_id},
+            json={"jsonrpc": "2.0", "method": "health", "id": next(_test_request_ids)},
         )
         parsed = response.json()
 
@@ -104,58 +101,45 @@ class TestDispatcherSchemaValidation:
     endpoint schemas using the Validator module.
     """
 
-    def test_missing_required_field(self, client: httpx.Client) -> None:
-        """Test that missing required fields are rejected."""
-        # test_endpoint requires 'required_string' and 'required_integer'
-        response = api(
-            client,
-            "test_endpoint",
-            {
-                "required_integer": 50,
-                "required_enum": "option_a",
-                # Missing 'required_string'
-            },
-        )
-
-        assert "error" in response
-        assert response["error"]["data"]["name"] == "BAD_REQUEST"
-        assert "required_string" in response["error"]["message"].lower()
-
-    def test_invalid_type_string_instead_of_integer(self, client: httpx.Client) -> None:
-        """Test that type validation rejects wrong types."""
-        response = api(
-            client,
-            "test_endpoint",
-            {
-                "required_string": "valid_string",
-                "required_integer": "not_an_integer",  # Should be integer
-                "required_enum": "option_a",
-            },
-        )
-
-        assert "error" in response
-        assert response["error"]["data"]["name"] == "BAD_REQUEST"
-        assert "required_integer" in response["error"]["message"].lower()
-
-    def test_array_item_type_validation(self, client: httpx.Client) -> None:
-        """Test that array items are validated for correct type."""
-        response = api(
-            client,
-            "test_endpoint",
-            {
-                "required_string": "test",
-                "required_integer": 50,
-                "optional_array_integers": [
-                    1,
-                    2,
-                    "not_integer",
-                    4,
-                ],  # Should be integers
-            },
-        )
+    @pytest.mark.parametrize(
+        "params,field",
+        [
+            pytest.param(
+                # test_endpoint requires 'required_string' and 'required_integer'
+                {"required_integer": 50, "required_enum": "option_a"},
+                "required_string",
+                id="missing_required_field",
+            ),
+            pytest.param(
+                {
+                    "required_string": "valid_string",
+                    "required_integer": "not_an_integer",  # Should be integer
+                    "required_enum": "option_a",
+                },
+                "required_integer",
+                id="string_instead_of_integer",
+            ),
+            pytest.param(
+                {
+                    "required_string": "test",
+                    "required_integer": 50,
+                    "optional_array_integers": [1, 2, "not_integer", 4],
+                },
+                None,
+                id="array_item_type",
+            ),
+        ],
+    )
+    def test_invalid_arguments_rejected(
+        self, client: httpx.Client, params: dict, field: str | None
+    ) -> None:
+        """Test that arguments failing schema validation are rejected."""
+        response = api(client, "test_endpoint", params)
 
         assert "error" in response
         assert response["error"]["data"]["name"] == "BAD_REQUEST"
+        if field is not None:
+            assert field in response["error"]["message"].lower()
 
     def test_valid_request_with_all_fields(self, client: httpx.Client) -> None:
         """Test that valid requests with multiple fields pass validation."""